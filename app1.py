@@ -1,8 +1,28 @@
 
 # app.py
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import streamlit as st
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+import polars as pl
+import matplotlib
+from matplotlib.figure import Figure
+
+# Non-interactive backend; independent Figure objects can be drawn from worker threads
+matplotlib.use("Agg")
+
+# Dashboard tiles don't need print resolution: smaller PNGs encode and
+# transfer faster, and simplified paths cut vertices before rasterizing
+matplotlib.rcParams.update({
+    "figure.dpi": 72,
+    "savefig.dpi": 72,
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10000
+})
 
 # -------------------------------------------------------
 # Page config
@@ -20,46 +40,69 @@ st.markdown(
 # -------------------------------------------------------
 # Load data
 # -------------------------------------------------------
+categorical_columns = [
+    "Field_of_Study",
+    "Gender",
+    "Current_Job_Level"
+]
+
+# Downcast target per numeric column. Ratings and counts fit in int8 and
+# salaries in int32; GPA stays float64 so it compares exactly against the
+# float64 slider bounds.
+numeric_columns = {
+    "University_GPA": None,
+    "Starting_Salary": "integer",
+    "Years_to_Promotion": "integer",
+    "Networking_Score": "integer",
+    "Job_Offers": "integer",
+    "Career_Satisfaction": "integer",
+    "Certifications": "integer"
+}
+
+
 @st.cache_data
 def load_data():
-    return pd.read_csv("education_career_success.csv")
+    # Label columns as categoricals so isin / groupby / counts work on integer codes
+    # The pyarrow engine (shipped with Streamlit) parses the CSV multithreaded
+    data = pd.read_csv(
+        "education_career_success.csv",
+        engine="pyarrow",
+        dtype={col: "category" for col in categorical_columns}
+    )
 
+    # Clean / prepare numeric columns once, inside the cache
+    for col, downcast in numeric_columns.items():
+        if col in data.columns:
+            data[col] = pd.to_numeric(data[col], errors="coerce", downcast=downcast)
 
-df = load_data()
+    # No sidebar selection can match a missing major or GPA, so drop those rows
+    data = data.dropna(subset=["Field_of_Study", "University_GPA"])
+
+    # Keep rows in GPA order so the GPA filter can binary-search a slice
+    data = data.sort_values("University_GPA", kind="stable", ignore_index=True)
+
+    # Sidebar options are fixed for the life of the cached frame
+    return (
+        data,
+        sorted(data["Field_of_Study"].dropna().unique()),
+        float(data["University_GPA"].min()),
+        float(data["University_GPA"].max())
+    )
 
-# -------------------------------------------------------
-# Clean / prepare data
-# -------------------------------------------------------
-numeric_columns = [
-    "University_GPA",
-    "Starting_Salary",
-    "Years_to_Promotion",
-    "Networking_Score",
-    "Job_Offers",
-    "Career_Satisfaction",
-    "Certifications"
-]
 
-for col in numeric_columns:
-    if col in df.columns:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
+df, field_options, gpa_min, gpa_max = load_data()
 
 # -------------------------------------------------------
 # Sidebar filters
 # -------------------------------------------------------
 st.sidebar.header("Filters")
 
-field_options = sorted(df["Field_of_Study"].dropna().unique())
-
 selected_fields = st.sidebar.multiselect(
     "Field of Study",
     options=field_options,
     default=field_options
 )
 
-gpa_min = float(df["University_GPA"].min())
-gpa_max = float(df["University_GPA"].max())
-
 gpa_range = st.sidebar.slider(
     "University GPA range",
     min_value=gpa_min,
@@ -70,10 +113,38 @@ gpa_range = st.sidebar.slider(
 # -------------------------------------------------------
 # Apply filters
 # -------------------------------------------------------
-filtered = df[
-    df["Field_of_Study"].isin(selected_fields)
-    & df["University_GPA"].between(gpa_range[0], gpa_range[1])
-]
+@st.cache_data
+def get_filtered(fields_tuple, gpa_lo, gpa_hi):
+    # The default sidebar state keeps every row, so skip slicing and masking
+    if (
+        len(fields_tuple) == len(field_options)
+        and gpa_lo <= gpa_min
+        and gpa_hi >= gpa_max
+    ):
+        return df
+
+    # Same bounds as between(gpa_lo, gpa_hi), found by binary search on the
+    # GPA-sorted rows; the field mask then only scans that slice
+    gpa_sorted = df["University_GPA"].to_numpy()
+    lo_i = np.searchsorted(gpa_sorted, gpa_lo, side="left")
+    hi_i = np.searchsorted(gpa_sorted, gpa_hi, side="right")
+
+    window = df.iloc[lo_i:hi_i]
+    fields = window["Field_of_Study"].cat
+
+    # Boolean lookup table over the category codes, so the field mask is a
+    # single gather. The extra trailing slot stays False, so the -1 code of
+    # a missing field never matches.
+    selected = np.zeros(len(fields.categories) + 1, dtype=bool)
+    selected_codes = fields.categories.get_indexer(fields_tuple)
+    selected[selected_codes[selected_codes >= 0]] = True
+
+    return window[selected[fields.codes.to_numpy()]]
+
+
+# Tuples are hashable, so the same filter selection hits the cache
+filter_key = (tuple(selected_fields), gpa_range[0], gpa_range[1])
+filtered = get_filtered(*filter_key)
 
 if filtered.empty:
     st.warning("No data matches the selected filters. Please adjust the sidebar filters.")
@@ -82,17 +153,60 @@ if filtered.empty:
 # -------------------------------------------------------
 # Overview statistics
 # -------------------------------------------------------
+@st.cache_data
+def numeric_summary(fields_tuple, gpa_lo, gpa_hi):
+    data = get_filtered(fields_tuple, gpa_lo, gpa_hi)
+    return data[list(numeric_columns)].agg(["count", "mean", "std", "min", "max"])
+
+
+@st.cache_data
+def categorical_summary(fields_tuple, gpa_lo, gpa_hi):
+    data = get_filtered(fields_tuple, gpa_lo, gpa_hi)
+    rows = {}
+
+    for col in categorical_columns:
+        counts = data[col].value_counts()
+        rows[col] = {
+            "unique": int((counts > 0).sum()),
+            "top": counts.idxmax(),
+            "freq": int(counts.max())
+        }
+
+    return pd.DataFrame.from_dict(rows, orient="index")
+
+
 st.markdown("### Overview statistics")
 
-# Convert to string to avoid Streamlit / Arrow mixed-type errors
-overview = filtered.describe(include="all").fillna("").astype(str)
-st.dataframe(overview)
+st.dataframe(numeric_summary(*filter_key))
+st.dataframe(categorical_summary(*filter_key))
+
+# -------------------------------------------------------
+# Figure pool
+# -------------------------------------------------------
+# One Figure per chart slot (keyed by chart title), kept for the session.
+# A session's reruns never overlap, and each figure is encoded to PNG right
+# after it is drawn, so a slot can be redrawn on the next rerun. The plain
+# dict is fetched here because worker threads cannot read st.session_state.
+figure_pool = st.session_state.setdefault("figure_pool", {})
+
+
+def pooled_figure(title, figsize):
+    fig = figure_pool.get(title)
+
+    if fig is None:
+        fig = figure_pool[title] = Figure(figsize=figsize)
+    else:
+        # Drops the old axes, including any colorbar axes
+        fig.clear()
+        fig.set_size_inches(figsize)
+
+    return fig, fig.subplots()
 
 # -------------------------------------------------------
 # Helper function for empty charts
 # -------------------------------------------------------
 def no_data_figure(title="No data available"):
-    fig, ax = plt.subplots(figsize=(6, 4))
+    fig, ax = pooled_figure(title, figsize=(6, 4))
     ax.text(
         0.5,
         0.5,
@@ -105,17 +219,151 @@ def no_data_figure(title="No data available"):
     fig.tight_layout()
     return fig
 
+# -------------------------------------------------------
+# Cached aggregations (keyed on the filter inputs)
+# -------------------------------------------------------
+def series_arrays(series):
+    # Plain (x, y) arrays for matplotlib; categorical labels become strings
+    index = series.index
+
+    if isinstance(index.dtype, pd.CategoricalDtype):
+        index = index.astype(str)
+
+    return index.to_numpy(), series.to_numpy(dtype=np.float32)
+
+
+@st.cache_data
+def gpa_histogram(fields_tuple, gpa_lo, gpa_hi):
+    data = get_filtered(fields_tuple, gpa_lo, gpa_hi)
+
+    # The slider bounds are the data range, so numpy can bin uniformly
+    # without its own min/max scan
+    return np.histogram(
+        data["University_GPA"].dropna().to_numpy(),
+        bins=10,
+        range=(gpa_lo, gpa_hi)
+    )
+
+
+@st.cache_data
+def group_aggregates(fields_tuple, gpa_lo, gpa_hi):
+    lf = pl.from_pandas(get_filtered(fields_tuple, gpa_lo, gpa_hi)).lazy()
+
+    def aggregate_by(key, aggregations):
+        return lf.drop_nulls(subset=key).group_by(key).agg(aggregations)
+
+    def mean_by(key, value):
+        return aggregate_by(key, [pl.col(value).mean()])
+
+    # One collect_all call lets Polars share the scan and run the groupings in parallel
+    by_field, by_years, by_network, by_certs = pl.collect_all([
+        # The salary bar, box plot and heatmap all key on Field_of_Study,
+        # so they share a single group_by
+        aggregate_by("Field_of_Study", [
+            pl.col("Starting_Salary").mean(),
+            pl.col("Career_Satisfaction").mean(),
+            pl.col("Career_Satisfaction").drop_nulls().alias("Satisfaction_Values"),
+        ]),
+        mean_by("Years_to_Promotion", "Starting_Salary"),
+        mean_by("Networking_Score", "Job_Offers"),
+        mean_by("Certifications", "Job_Offers"),
+    ])
+
+    # Back to pandas only at the matplotlib boundary, one conversion per frame
+    by_field = by_field.to_pandas().set_index("Field_of_Study")
+    by_years = by_years.to_pandas().set_index("Years_to_Promotion")
+    by_network = by_network.to_pandas().set_index("Networking_Score")
+    by_certs = by_certs.to_pandas().set_index("Certifications")
+
+    return {
+        "salary_by_field": series_arrays(
+            by_field["Starting_Salary"].dropna().sort_values(ascending=False)
+        ),
+        "sat_by_field": series_arrays(
+            by_field["Career_Satisfaction"].dropna().sort_values(ascending=True)
+        ),
+        "sat_values_by_field": {
+            field: np.asarray(values)
+            for field, values in sorted(by_field["Satisfaction_Values"].items())
+            if len(values)
+        },
+        "salary_by_years": series_arrays(
+            by_years["Starting_Salary"].dropna().sort_index()
+        ),
+        "offers_by_network": series_arrays(
+            by_network["Job_Offers"].dropna().sort_index()
+        ),
+        "offers_by_certifications": series_arrays(
+            by_certs["Job_Offers"].dropna().sort_index()
+        ),
+    }
+
+
+@st.cache_data
+def gpa_promotion_points(fields_tuple, gpa_lo, gpa_hi):
+    data = get_filtered(fields_tuple, gpa_lo, gpa_hi)
+    data = data.dropna(subset=["Years_to_Promotion", "University_GPA"])
+    return (
+        data["Years_to_Promotion"].to_numpy(),
+        data["University_GPA"].to_numpy()
+    )
+
+
+@st.cache_data
+def satisfaction_counts_by_gender(fields_tuple, gpa_lo, gpa_hi):
+    data = get_filtered(fields_tuple, gpa_lo, gpa_hi)
+    data = data.dropna(subset=["Gender", "Career_Satisfaction"])
+
+    genders = data["Gender"].cat
+    scores = data["Career_Satisfaction"].to_numpy().astype(np.intp)
+    n_scores = int(scores.max()) + 1 if len(scores) else 0
+
+    # Satisfaction is an integer rating, so one bincount over
+    # (gender code, score) pairs gives every gender's distribution
+    counts = np.bincount(
+        genders.codes.to_numpy() * n_scores + scores,
+        minlength=len(genders.categories) * n_scores
+    ).reshape(len(genders.categories), n_scores)
+
+    return {
+        gender: row
+        for gender, row in zip(genders.categories, counts)
+        if row.sum()
+    }
+
+
+@st.cache_data
+def job_level_counts(fields_tuple, gpa_lo, gpa_hi):
+    data = get_filtered(fields_tuple, gpa_lo, gpa_hi)
+    levels = data["Current_Job_Level"].cat
+    codes = levels.codes.to_numpy()
+
+    # Count straight off the integer codes; -1 marks a missing level
+    counts = np.bincount(codes[codes >= 0], minlength=len(levels.categories))
+
+    # Drop levels absent from the filtered rows, largest wedge first
+    observed = np.flatnonzero(counts)
+    order = observed[np.argsort(-counts[observed], kind="stable")]
+    return levels.categories.astype(str).to_numpy()[order], counts[order]
+
 # -------------------------------------------------------
 # Helper plotting functions
 # -------------------------------------------------------
-def plot_gpa_hist(data):
-    chart_data = data["University_GPA"].dropna()
+def plot_gpa_hist(histogram):
+    counts, edges = histogram
 
-    if chart_data.empty:
+    if counts.sum() == 0:
         return no_data_figure("Histogram of University GPA")
 
-    fig, ax = plt.subplots(figsize=(6, 4))
-    ax.hist(chart_data, bins=10, edgecolor="black")
+    fig, ax = pooled_figure("Histogram of University GPA", figsize=(6, 4))
+    ax.bar(
+        edges[:-1],
+        counts,
+        width=np.diff(edges),
+        align="edge",
+        edgecolor="black",
+        rasterized=True
+    )
     ax.set_title("Histogram of University GPA")
     ax.set_xlabel("University GPA")
     ax.set_ylabel("Frequency")
@@ -123,19 +371,14 @@ def plot_gpa_hist(data):
     return fig
 
 
-def plot_salary_by_field(data):
-    avg_salary_by_field = (
-        data.dropna(subset=["Field_of_Study", "Starting_Salary"])
-        .groupby("Field_of_Study")["Starting_Salary"]
-        .mean()
-        .sort_values(ascending=False)
-    )
+def plot_salary_by_field(avg_salary):
+    fields, salaries = avg_salary
 
-    if avg_salary_by_field.empty:
+    if len(salaries) == 0:
         return no_data_figure("Average Starting Salary by Field of Study")
 
-    fig, ax = plt.subplots(figsize=(8, 4))
-    ax.bar(avg_salary_by_field.index, avg_salary_by_field.values)
+    fig, ax = pooled_figure("Average Starting Salary by Field of Study", figsize=(8, 4))
+    ax.bar(fields, salaries, rasterized=True)
     ax.set_title("Average Starting Salary by Field of Study")
     ax.set_xlabel("Field of Study")
     ax.set_ylabel("Average Starting Salary")
@@ -144,19 +387,14 @@ def plot_salary_by_field(data):
     return fig
 
 
-def plot_salary_by_promotion_years(data):
-    avg_salary_by_years = (
-        data.dropna(subset=["Years_to_Promotion", "Starting_Salary"])
-        .groupby("Years_to_Promotion")["Starting_Salary"]
-        .mean()
-        .sort_index()
-    )
+def plot_salary_by_promotion_years(avg_salary):
+    years, salaries = avg_salary
 
-    if avg_salary_by_years.empty:
+    if len(salaries) == 0:
         return no_data_figure("Average Starting Salary by Years to Promotion")
 
-    fig, ax = plt.subplots(figsize=(6, 4))
-    ax.plot(avg_salary_by_years.index, avg_salary_by_years.values, marker="o")
+    fig, ax = pooled_figure("Average Starting Salary by Years to Promotion", figsize=(6, 4))
+    ax.plot(years, salaries, marker="o")
     ax.set_title("Average Starting Salary by Years to Promotion")
     ax.set_xlabel("Years to Promotion")
     ax.set_ylabel("Average Starting Salary")
@@ -164,19 +402,14 @@ def plot_salary_by_promotion_years(data):
     return fig
 
 
-def plot_job_offers_by_networking(data):
-    avg_offers_by_network = (
-        data.dropna(subset=["Networking_Score", "Job_Offers"])
-        .groupby("Networking_Score")["Job_Offers"]
-        .mean()
-        .sort_index()
-    )
+def plot_job_offers_by_networking(avg_offers):
+    scores, offers = avg_offers
 
-    if avg_offers_by_network.empty:
+    if len(offers) == 0:
         return no_data_figure("Average Job Offers by Networking Score")
 
-    fig, ax = plt.subplots(figsize=(6, 4))
-    ax.plot(avg_offers_by_network.index, avg_offers_by_network.values, marker="o")
+    fig, ax = pooled_figure("Average Job Offers by Networking Score", figsize=(6, 4))
+    ax.plot(scores, offers, marker="o")
     ax.set_title("Average Job Offers by Networking Score")
     ax.set_xlabel("Networking Score")
     ax.set_ylabel("Average Job Offers")
@@ -184,18 +417,45 @@ def plot_job_offers_by_networking(data):
     return fig
 
 
-def plot_gpa_vs_promotion(data):
-    chart_data = data.dropna(subset=["Years_to_Promotion", "University_GPA"])
+# Above this many points the scatter is drawn as a density grid instead
+SCATTER_MAX_POINTS = 5000
+
+
+def bin_points_2d(x, y, bins=60):
+    # Uniform bins, so each point's cell comes from integer rescaling of its
+    # coordinates (no searchsorted); one bincount then counts every cell
+    def cell_index(values):
+        lo, hi = float(values.min()), float(values.max())
+        scale = bins / (hi - lo) if hi > lo else 0.0
+        index = ((values - lo) * scale).astype(np.intp)
+        return np.minimum(index, bins - 1), (lo, hi)
+
+    x_cells, x_range = cell_index(x)
+    y_cells, y_range = cell_index(y)
+
+    counts = np.bincount(y_cells * bins + x_cells, minlength=bins * bins)
+    return counts.reshape(bins, bins), x_range + y_range
 
-    if chart_data.empty:
+
+def plot_gpa_vs_promotion(points):
+    x, y = points
+
+    if len(x) == 0:
         return no_data_figure("Do Higher GPAs Lead to Faster Promotions?")
 
-    fig, ax = plt.subplots(figsize=(6, 4))
-    ax.scatter(
-        chart_data["Years_to_Promotion"],
-        chart_data["University_GPA"],
-        alpha=0.7
-    )
+    fig, ax = pooled_figure("Do Higher GPAs Lead to Faster Promotions?", figsize=(6, 4))
+
+    if len(x) > SCATTER_MAX_POINTS:
+        counts, extent = bin_points_2d(x, y)
+        ax.imshow(
+            np.ma.masked_equal(counts, 0),
+            origin="lower",
+            extent=extent,
+            aspect="auto"
+        )
+    else:
+        ax.scatter(x, y, alpha=0.7, rasterized=True)
+
     ax.set_title("Do Higher GPAs Lead to Faster Promotions?")
     ax.set_xlabel("Years to Promotion")
     ax.set_ylabel("University GPA")
@@ -203,22 +463,34 @@ def plot_gpa_vs_promotion(data):
     return fig
 
 
-def plot_satisfaction_by_gender(data):
-    chart_data = data.dropna(subset=["Gender", "Career_Satisfaction"])
-    genders = chart_data["Gender"].unique()
-
-    satisfaction_data = [
-        chart_data[chart_data["Gender"] == g]["Career_Satisfaction"]
-        for g in genders
-    ]
-
-    if len(satisfaction_data) == 0:
+def plot_satisfaction_by_gender(sat_counts):
+    if not sat_counts:
         return no_data_figure("How Does Career Satisfaction Differ by Gender?")
 
-    fig, ax = plt.subplots(figsize=(6, 4))
-    ax.violinplot(satisfaction_data, showmeans=True)
-    ax.set_xticks(range(1, len(genders) + 1))
-    ax.set_xticklabels(genders)
+    fig, ax = pooled_figure("How Does Career Satisfaction Differ by Gender?", figsize=(6, 4))
+
+    # Violin-style outline drawn straight from the score counts (no KDE),
+    # with the mean and the min/max range marked like showmeans=True
+    for pos, counts in enumerate(sat_counts.values(), start=1):
+        observed = np.flatnonzero(counts)
+        lo, hi = observed[0], observed[-1]
+        scores = np.arange(lo, hi + 1)
+        half_width = 0.4 * counts[lo:hi + 1] / counts.max()
+        mean = (scores * counts[lo:hi + 1]).sum() / counts.sum()
+
+        ax.fill_betweenx(
+            scores,
+            pos - half_width,
+            pos + half_width,
+            step="mid",
+            color="C0",
+            alpha=0.3
+        )
+        ax.hlines(mean, pos - 0.2, pos + 0.2, colors="C0")
+        ax.vlines(pos, lo, hi, colors="C0")
+
+    ax.set_xticks(range(1, len(sat_counts) + 1))
+    ax.set_xticklabels(list(sat_counts))
     ax.set_title("How Does Career Satisfaction Differ by Gender?")
     ax.set_xlabel("Gender")
     ax.set_ylabel("Career Satisfaction")
@@ -226,19 +498,14 @@ def plot_satisfaction_by_gender(data):
     return fig
 
 
-def plot_worklife_by_field(data):
-    chart_data = data.dropna(subset=["Field_of_Study", "Career_Satisfaction"])
-    fields = chart_data["Field_of_Study"].unique()
-
-    sat_data = [
-        chart_data[chart_data["Field_of_Study"] == f]["Career_Satisfaction"]
-        for f in fields
-    ]
-
-    if len(sat_data) == 0:
+def plot_worklife_by_field(sat_values):
+    if not sat_values:
         return no_data_figure("Career Satisfaction by Field of Study")
 
-    fig, ax = plt.subplots(figsize=(8, 4))
+    fields = list(sat_values)
+    sat_data = list(sat_values.values())
+
+    fig, ax = pooled_figure("Career Satisfaction by Field of Study", figsize=(8, 4))
 
     # IMPORTANT FIX:
     # Newer Matplotlib uses tick_labels instead of labels
@@ -252,16 +519,16 @@ def plot_worklife_by_field(data):
     return fig
 
 
-def plot_joblevel_pie(data):
-    job_counts = data["Current_Job_Level"].dropna().value_counts()
+def plot_joblevel_pie(job_counts):
+    levels, counts = job_counts
 
-    if job_counts.empty:
+    if len(counts) == 0:
         return no_data_figure("Distribution of Job Levels Among Graduates")
 
-    fig, ax = plt.subplots(figsize=(5, 5))
+    fig, ax = pooled_figure("Distribution of Job Levels Among Graduates", figsize=(5, 5))
     ax.pie(
-        job_counts.values,
-        labels=job_counts.index,
+        counts,
+        labels=levels,
         autopct="%1.1f%%",
         startangle=90
     )
@@ -270,19 +537,14 @@ def plot_joblevel_pie(data):
     return fig
 
 
-def plot_offers_vs_certifications(data):
-    avg_offers = (
-        data.dropna(subset=["Certifications", "Job_Offers"])
-        .groupby("Certifications")["Job_Offers"]
-        .mean()
-        .sort_index()
-    )
+def plot_offers_vs_certifications(avg_offers):
+    certifications, offers = avg_offers
 
-    if avg_offers.empty:
+    if len(offers) == 0:
         return no_data_figure("Job Offers vs Certifications")
 
-    fig, ax = plt.subplots(figsize=(6, 4))
-    ax.plot(avg_offers.index, avg_offers.values, marker="o")
+    fig, ax = pooled_figure("Job Offers vs Certifications", figsize=(6, 4))
+    ax.plot(certifications, offers, marker="o")
     ax.set_title("Job Offers vs Certifications")
     ax.set_xlabel("Certifications")
     ax.set_ylabel("Average Job Offers")
@@ -290,90 +552,159 @@ def plot_offers_vs_certifications(data):
     return fig
 
 
-def plot_satisfaction_heatmap(data):
-    avg_sat = (
-        data.dropna(subset=["Field_of_Study", "Career_Satisfaction"])
-        .groupby("Field_of_Study")["Career_Satisfaction"]
-        .mean()
-        .sort_values(ascending=True)
-    )
+# Colormap for the satisfaction heatmap, looked up once
+HEATMAP_CMAP = matplotlib.colormaps["viridis"]
+
 
-    if avg_sat.empty:
+def plot_satisfaction_heatmap(avg_sat):
+    fields, satisfaction = avg_sat
+
+    if len(satisfaction) == 0:
         return no_data_figure("Average Career Satisfaction by Major")
 
-    fig, ax = plt.subplots(figsize=(6, 4))
-    cax = ax.imshow(avg_sat.values.reshape(-1, 1), aspect="auto")
-    ax.set_yticks(range(len(avg_sat.index)))
-    ax.set_yticklabels(avg_sat.index)
-    ax.set_xticks([0])
-    ax.set_xticklabels(["Career Satisfaction"])
-    ax.set_title("Average Career Satisfaction by Major")
-    fig.colorbar(cax, ax=ax)
-    fig.tight_layout()
-    return fig
+    # Colour each major's cell straight from the colormap, so no imshow or
+    # colorbar figure has to be laid out and encoded
+    span = satisfaction.max() - satisfaction.min()
+    norm = (satisfaction - satisfaction.min()) / span if span else np.zeros_like(satisfaction)
+    rgba = (HEATMAP_CMAP(norm) * 255).astype(np.uint8)
+
+    # Light text on the dark end of the colormap
+    luminance = rgba[:, :3] @ np.array([0.299, 0.587, 0.114]) / 255
+    cell_styles = [
+        f"background-color: #{r:02x}{g:02x}{b:02x}; "
+        f"color: {'white' if lum < 0.5 else 'black'}"
+        for (r, g, b, _), lum in zip(rgba, luminance)
+    ]
+
+    table = pd.DataFrame(
+        {"Average Career Satisfaction": satisfaction},
+        index=pd.Index(fields, name="Major")
+    )
+    return table.style.apply(lambda col: cell_styles).format("{:.2f}")
 
 # -------------------------------------------------------
 # Layout
 # -------------------------------------------------------
-st.markdown("### 1. Student Performance & Outcomes")
-
-col1, col2 = st.columns(2)
-
-with col1:
-    st.pyplot(plot_gpa_hist(filtered))
-    st.caption("Distribution of students' university GPA.")
-
-with col2:
-    st.pyplot(plot_salary_by_field(filtered))
-    st.caption("Average starting salary by field of study.")
+aggregates = group_aggregates(*filter_key)
 
-st.markdown("### 2. Promotions, Networking and Offers")
 
-col3, col4 = st.columns(2)
+def build_chart(spec):
+    plot_fn, chart_input, _ = spec
+    chart = plot_fn(chart_input)
 
-with col3:
-    st.pyplot(plot_salary_by_promotion_years(filtered))
-    st.caption("How starting salary changes with years to first promotion.")
+    # Encode figures to PNG here, at savefig.dpi, rather than through
+    # st.pyplot's own high-dpi re-save on the main thread
+    if isinstance(chart, Figure):
+        png = io.BytesIO()
+        chart.savefig(png, format="png", bbox_inches="tight")
+        chart = png
 
-with col4:
-    st.pyplot(plot_job_offers_by_networking(filtered))
-    st.caption("Average job offers for each networking score.")
+    return chart
 
-st.markdown("### 3. GPA, Satisfaction and Work–Life Balance")
 
-col5, col6 = st.columns(2)
+def render_charts(chart_specs):
+    # The two charts are independent, so build and encode them on worker threads
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        charts = list(executor.map(build_chart, chart_specs))
 
-with col5:
-    st.pyplot(plot_gpa_vs_promotion(filtered))
-    st.caption("Relationship between GPA and time to promotion.")
+    for col, chart, (_, _, caption) in zip(st.columns(2), charts, chart_specs):
+        with col:
+            # The satisfaction heatmap comes back as a styled table
+            if isinstance(chart, io.BytesIO):
+                st.image(chart, width="stretch")
+            else:
+                st.dataframe(chart)
 
-with col6:
-    st.pyplot(plot_satisfaction_by_gender(filtered))
-    st.caption("Career satisfaction distribution by gender.")
+            st.caption(caption)
 
-st.markdown("### 4. Job Levels and Overall Satisfaction")
 
-col7, col8 = st.columns(2)
-
-with col7:
-    st.pyplot(plot_worklife_by_field(filtered))
-    st.caption("Which fields report better career satisfaction.")
-
-with col8:
-    st.pyplot(plot_joblevel_pie(filtered))
-    st.caption("Proportion of graduates at each job level.")
-
-st.markdown("### 5. Extra: Offers vs Certifications and Satisfaction by Major")
-
-col9, col10 = st.columns(2)
-
-with col9:
-    st.pyplot(plot_offers_vs_certifications(filtered))
-    st.caption("Average job offers by number of certifications.")
+# on_change="rerun" makes tab.open report the selected tab, so hidden
+# tabs skip building their figures
+tab1, tab2, tab3, tab4, tab5 = st.tabs(
+    ["Performance", "Promotion", "GPA/Satisfaction", "Job Levels", "Extras"],
+    key="chart_tab",
+    on_change="rerun"
+)
 
-with col10:
-    st.pyplot(plot_satisfaction_heatmap(filtered))
-    st.caption("Average career satisfaction across majors.")
+with tab1:
+    if tab1.open:
+        st.markdown("### 1. Student Performance & Outcomes")
+        render_charts([
+            (
+                plot_gpa_hist,
+                gpa_histogram(*filter_key),
+                "Distribution of students' university GPA."
+            ),
+            (
+                plot_salary_by_field,
+                aggregates["salary_by_field"],
+                "Average starting salary by field of study."
+            ),
+        ])
+
+with tab2:
+    if tab2.open:
+        st.markdown("### 2. Promotions, Networking and Offers")
+        render_charts([
+            (
+                plot_salary_by_promotion_years,
+                aggregates["salary_by_years"],
+                "How starting salary changes with years to first promotion."
+            ),
+            (
+                plot_job_offers_by_networking,
+                aggregates["offers_by_network"],
+                "Average job offers for each networking score."
+            ),
+        ])
+
+with tab3:
+    if tab3.open:
+        st.markdown("### 3. GPA, Satisfaction and Work–Life Balance")
+        render_charts([
+            (
+                plot_gpa_vs_promotion,
+                gpa_promotion_points(*filter_key),
+                "Relationship between GPA and time to promotion."
+            ),
+            (
+                plot_satisfaction_by_gender,
+                satisfaction_counts_by_gender(*filter_key),
+                "Career satisfaction distribution by gender."
+            ),
+        ])
+
+with tab4:
+    if tab4.open:
+        st.markdown("### 4. Job Levels and Overall Satisfaction")
+        render_charts([
+            (
+                plot_worklife_by_field,
+                aggregates["sat_values_by_field"],
+                "Which fields report better career satisfaction."
+            ),
+            (
+                plot_joblevel_pie,
+                job_level_counts(*filter_key),
+                "Proportion of graduates at each job level."
+            ),
+        ])
+
+with tab5:
+    if tab5.open:
+        st.markdown("### 5. Extra: Offers vs Certifications and Satisfaction by Major")
+        render_charts([
+            (
+                plot_offers_vs_certifications,
+                aggregates["offers_by_certifications"],
+                "Average job offers by number of certifications."
+            ),
+            (
+                plot_satisfaction_heatmap,
+                aggregates["sat_by_field"],
+                "Average career satisfaction across majors."
+            ),
+        ])
 
 st.markdown(
     """